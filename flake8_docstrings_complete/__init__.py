@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import argparse
 import ast
+import os
 import re
-from pathlib import Path
-from typing import Iterable, Iterator
-
-from flake8.options.manager import OptionManager
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple, cast
 
 from . import args, attrs, docstring, raises, types_
-from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE
+from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE, STATEMENT_FIELDS, split_msg
+
+# Only needed for the type hints of the option handling
+if TYPE_CHECKING:  # pragma: nocover
+    import argparse
+
+    from flake8.options.manager import OptionManager
 
 DOCSTR_MISSING_CODE = f"{ERROR_CODE_PREFIX}010"
 DOCSTR_MISSING_MSG = (
@@ -52,6 +55,8 @@ MULT_YIELDS_SECTIONS_IN_DOCSTR_MSG = (
     "section, found %s"
     f"{MORE_INFO_BASE}{MULT_YIELDS_SECTIONS_IN_DOCSTR_CODE.lower()}"
 )
+_MULT_RETURNS_PREFIX, _MULT_RETURNS_SUFFIX = split_msg(MULT_RETURNS_SECTIONS_IN_DOCSTR_MSG)
+_MULT_YIELDS_PREFIX, _MULT_YIELDS_SUFFIX = split_msg(MULT_YIELDS_SECTIONS_IN_DOCSTR_MSG)
 
 PRIVATE_FUNCTION_PATTERN = r"_[^_].*"
 TEST_FILENAME_PATTERN_ARG_NAME = "--docstrings-complete-test-filename-pattern"
@@ -63,8 +68,42 @@ FIXTURE_FILENAME_PATTERN_DEFAULT = r"conftest\.py"
 FIXTURE_DECORATOR_PATTERN_ARG_NAME = "--docstrings-complete-fixture-decorator-pattern"
 FIXTURE_DECORATOR_PATTERN_DEFAULT = r"(^|\.)fixture$"
 
+_PRIVATE_FUNCTION_PATTERN = re.compile(PRIVATE_FUNCTION_PATTERN)
+
+# Nodes that do not contain any nodes that need to be visited, such as names, constants and
+# operators, which are the majority of the nodes in a tree
+_LEAF_NODE_TYPES = frozenset(
+    (
+        ast.Name,
+        ast.Constant,
+        ast.alias,
+        ast.Pass,
+        ast.Break,
+        ast.Continue,
+        *ast.expr_context.__subclasses__(),
+        *ast.boolop.__subclasses__(),
+        *ast.operator.__subclasses__(),
+        *ast.unaryop.__subclasses__(),
+        *ast.cmpop.__subclasses__(),
+    )
+)
+
+# Module level references to the node types checked on every visit, avoids the repeated attribute
+# lookup on the ast module. The ast node types are never subclassed, so throughout the package
+# checks for a specific node type compare type() by identity, which is cheaper than isinstance and
+# is why pylint's unidiomatic-typecheck is disabled for the project. isinstance is only used for
+# ast.AST itself, which is the base of all the node types
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Constant = ast.Constant
+_Expr = ast.Expr
+_Name = ast.Name
+
+
+# Maps the dashes in CLI argument names to the underscores used in attribute names
+_DASH_TO_UNDERSCORE = str.maketrans("-", "_")
+
 
-# Helper function for option management, tested in integration tests
 def _cli_arg_name_to_attr(cli_arg_name: str) -> str:
     """Transform CLI argument name to the attribute name on the namespace.
 
@@ -74,7 +113,59 @@ def _cli_arg_name_to_attr(cli_arg_name: str) -> str:
     Returns:
         The namespace name for the argument.
     """
-    return cli_arg_name.lstrip("-").replace("-", "_")  # pragma: nocover
+    return cli_arg_name.translate(_DASH_TO_UNDERSCORE).lstrip("_")
+
+
+# The attribute names of the options on the namespace passed to Plugin.parse_options
+_TEST_FILENAME_PATTERN_ATTR = _cli_arg_name_to_attr(TEST_FILENAME_PATTERN_ARG_NAME)
+_TEST_FUNCTION_PATTERN_ATTR = _cli_arg_name_to_attr(TEST_FUNCTION_PATTERN_ARG_NAME)
+_FIXTURE_FILENAME_PATTERN_ATTR = _cli_arg_name_to_attr(FIXTURE_FILENAME_PATTERN_ARG_NAME)
+_FIXTURE_DECORATOR_PATTERN_ATTR = _cli_arg_name_to_attr(FIXTURE_DECORATOR_PATTERN_ARG_NAME)
+
+
+def _has_test_function_prefix(name: str) -> bool:
+    """Check whether a function name matches the default test function pattern.
+
+    The default pattern only checks the start of the name, which does not need a regex.
+
+    Args:
+        name: The name of the function to check.
+
+    Returns:
+        Whether the name starts with the prefix of test functions.
+    """
+    return name.startswith("test_")
+
+
+def _get_docstr_node(
+    node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef,
+) -> ast.Constant | None:
+    """Get the docstring node of a function or class.
+
+    Args:
+        node: The function or class to get the docstring node for.
+
+    Returns:
+        The docstring node or None if the function or class does not have a docstring.
+    """
+    if node.body and type(node.body[0]) is _Expr:
+        value = node.body[0].value
+        if type(value) is _Constant and type(value.value) is str:
+            return value
+    return None
+
+
+def _parse_docstr(docstr_node: ast.Constant) -> docstring.Docstring:
+    """Parse the docstring of a docstring node.
+
+    Args:
+        docstr_node: The docstring node to parse, as returned by _get_docstr_node.
+
+    Returns:
+        The information about the docstring.
+    """
+    # _get_docstr_node only returns nodes with a str value
+    return docstring.parse(value=cast(str, docstr_node.value))
 
 
 def _check_returns(
@@ -94,7 +185,7 @@ def _check_returns(
     Yields:
         All the problems with the returns section.
     """
-    return_nodes_with_value = list(node for node in return_nodes if node.value is not None)
+    return_nodes_with_value = [node for node in return_nodes if node.value is not None]
 
     # Check for return statements with value and no returns section in docstring
     if return_nodes_with_value and not docstr_info.returns_sections and not is_private:
@@ -108,7 +199,7 @@ def _check_returns(
         yield types_.Problem(
             docstr_node.lineno,
             docstr_node.col_offset,
-            MULT_RETURNS_SECTIONS_IN_DOCSTR_MSG % ",".join(docstr_info.returns_sections),
+            _MULT_RETURNS_PREFIX + ",".join(docstr_info.returns_sections) + _MULT_RETURNS_SUFFIX,
         )
 
     # Check for returns section in docstring in function that does not return a value
@@ -135,7 +226,7 @@ def _check_yields(
     Yields:
         All the problems with the yields section.
     """
-    yield_nodes_with_value = list(node for node in yield_nodes if node.value is not None)
+    yield_nodes_with_value = [node for node in yield_nodes if node.value is not None]
 
     # Check for yield statements with value and no yields section in docstring
     if yield_nodes_with_value and not docstr_info.yields_sections and not is_private:
@@ -149,7 +240,7 @@ def _check_yields(
         yield types_.Problem(
             docstr_node.lineno,
             docstr_node.col_offset,
-            MULT_YIELDS_SECTIONS_IN_DOCSTR_MSG % ",".join(docstr_info.yields_sections),
+            _MULT_YIELDS_PREFIX + ",".join(docstr_info.yields_sections) + _MULT_YIELDS_SUFFIX,
         )
 
     # Check for yields section in docstring in function that does not yield a value
@@ -159,8 +250,8 @@ def _check_yields(
         )
 
 
-class VisitorWithinFunction(ast.NodeVisitor):
-    """Visits AST nodes within a functions but not nested functions or classes.
+class _FunctionNodes(NamedTuple):
+    """The nodes within a function but not nested functions or classes.
 
     Attrs:
         return_nodes: All the return nodes encountered within the function.
@@ -171,78 +262,6 @@ class VisitorWithinFunction(ast.NodeVisitor):
     return_nodes: list[ast.Return]
     yield_nodes: list[ast.Yield | ast.YieldFrom]
     raise_nodes: list[ast.Raise]
-    _visited_once: bool
-
-    def __init__(self) -> None:
-        """Construct."""
-        self.return_nodes = []
-        self.yield_nodes = []
-        self.raise_nodes = []
-        self._visited_once = False
-
-    # The function must be called the same as the name of the node
-    def visit_Return(self, node: ast.Return) -> None:  # pylint: disable=invalid-name
-        """Record return node.
-
-        Args:
-            node: The return node to record.
-        """
-        self.return_nodes.append(node)
-
-        # Ensure recursion continues
-        self.generic_visit(node)
-
-    # The function must be called the same as the name of the node
-    def visit_Yield(self, node: ast.Yield) -> None:  # pylint: disable=invalid-name
-        """Record yield node.
-
-        Args:
-            node: The yield node to record.
-        """
-        self.yield_nodes.append(node)
-
-        # Ensure recursion continues
-        self.generic_visit(node)
-
-    # The function must be called the same as the name of the node
-    def visit_YieldFrom(self, node: ast.YieldFrom) -> None:  # pylint: disable=invalid-name
-        """Record yield from node.
-
-        Args:
-            node: The yield from node to record.
-        """
-        self.yield_nodes.append(node)
-
-        # Ensure recursion continues
-        self.generic_visit(node)
-
-    # The function must be called the same as the name of the node
-    def visit_Raise(self, node: ast.Raise) -> None:  # pylint: disable=invalid-name
-        """Record raise node.
-
-        Args:
-            node: The raise node to record.
-        """
-        self.raise_nodes.append(node)
-
-        # Ensure recursion continues
-        self.generic_visit(node)
-
-    def visit_once(self, node: ast.AST) -> None:
-        """Visit the node once and then skip.
-
-        Args:
-            node: The node being visited.
-        """
-        if not self._visited_once:
-            self._visited_once = True
-            self.generic_visit(node=node)
-
-    # Ensure that nested functions and classes are not iterated over
-    # The functions must be called the same as the name of the node
-    visit_FunctionDef = visit_once  # noqa: N815,DCO063
-    visit_AsyncFunctionDef = visit_once  # noqa: N815,DCO063
-    visit_ClassDef = visit_once  # noqa: N815,DCO063
 
 
 class Visitor(ast.NodeVisitor):
@@ -254,14 +273,15 @@ class Visitor(ast.NodeVisitor):
 
     problems: list[types_.Problem]
     _file_type: types_.FileType
-    _test_function_pattern: str
-    _fixture_decorator_pattern: str
+    _is_test_function_name: Callable[[str], object]
+    _fixture_decorator_pattern: re.Pattern[str]
+    _function_nodes: list[_FunctionNodes | None]
 
     def __init__(
         self,
         file_type: types_.FileType,
-        test_function_pattern: str,
-        fixture_decorator_pattern: str,
+        test_function_pattern: re.Pattern[str],
+        fixture_decorator_pattern: re.Pattern[str],
     ) -> None:
         """Construct.
 
@@ -272,8 +292,15 @@ class Visitor(ast.NodeVisitor):
         """
         self.problems = []
         self._file_type = file_type
-        self._test_function_pattern = test_function_pattern
+        self._is_test_function_name = (
+            _has_test_function_prefix
+            if test_function_pattern.pattern == TEST_FUNCTION_PATTERN_DEFAULT
+            else test_function_pattern.match
+        )
         self._fixture_decorator_pattern = fixture_decorator_pattern
+        # The nodes of the function currently being visited are recorded during the single pass
+        # over the tree, None if the current scope is not a function
+        self._function_nodes = [None]
 
     def _is_fixture_decorator(self, node: ast.expr) -> bool:
         """Determine whether an expression is a fixture decorator.
@@ -286,17 +313,15 @@ class Visitor(ast.NodeVisitor):
         """
         # Handle variable
         fixture_name: str | None = None
-        if isinstance(node, ast.Name):
+        if type(node) is _Name:
             fixture_name = node.id
-        if isinstance(node, ast.Attribute):
+        if type(node) is _Attribute:
             fixture_name = node.attr
         if fixture_name is not None:
-            return (
-                re.search(self._fixture_decorator_pattern, fixture_name, re.IGNORECASE) is not None
-            )
+            return self._fixture_decorator_pattern.search(fixture_name) is not None
 
         # Handle call
-        if isinstance(node, ast.Call):
+        if type(node) is _Call:
             return self._is_fixture_decorator(node=node.func)
 
         # No valid syntax can reach here
@@ -311,17 +336,17 @@ class Visitor(ast.NodeVisitor):
         Returns:
             Whether the node is an overload decorator.
         """
-        if isinstance(node, ast.Name):
+        if type(node) is _Name:
             return node.id == "overload"
 
         # Handle call
-        if isinstance(node, ast.Call):
+        if type(node) is _Call:
             return self._is_overload_decorator(node=node.func)
 
         # Handle attr
-        if isinstance(node, ast.Attribute):
+        if type(node) is _Attribute:
             value = node.value
-            return node.attr == "overload" and isinstance(value, ast.Name) and value.id == "typing"
+            return node.attr == "overload" and type(value) is _Name and value.id == "typing"
 
         # There is no valid syntax that gets to here
         return False  # pragma: nocover
@@ -339,136 +364,233 @@ class Visitor(ast.NodeVisitor):
             Whether to skip the function.
         """
         # Check for properties
-        if any(attrs.is_property_decorator(decorator) for decorator in node.decorator_list):
-            return True
+        for decorator in node.decorator_list:
+            if attrs.is_property_decorator(decorator):
+                return True
 
         # Check for test functions
-        if self._file_type == types_.FileType.TEST and re.match(
-            self._test_function_pattern, node.name
-        ):
+        if self._file_type == types_.FileType.TEST and self._is_test_function_name(node.name):
             return True
 
         # Check for fixtures
         if self._file_type in {types_.FileType.TEST, types_.FileType.FIXTURE}:
-            return any(self._is_fixture_decorator(decorator) for decorator in node.decorator_list)
+            for decorator in node.decorator_list:
+                if self._is_fixture_decorator(decorator):
+                    return True
+            return False
 
         # Check for overload
-        if any(self._is_overload_decorator(decorator) for decorator in node.decorator_list):
-            return True
+        for decorator in node.decorator_list:
+            if self._is_overload_decorator(decorator):
+                return True
 
         return False
 
-    def visit_any_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+    def _check_function(
+        self, node: ast.FunctionDef | ast.AsyncFunctionDef, function_nodes: _FunctionNodes
+    ) -> Iterator[types_.Problem]:
         """Check a function definition node.
 
         Args:
             node: The function definition to check.
+            function_nodes: The nodes within the function.
+
+        Yields:
+            All the problems with the function.
         """
-        if not self._skip_function(node=node):
-            # Check docstring is defined
-            if ast.get_docstring(node) is None:
-                self.problems.append(
-                    types_.Problem(
-                        lineno=node.lineno, col_offset=node.col_offset, msg=DOCSTR_MISSING_MSG
-                    )
-                )
+        # Check docstring is defined
+        docstr_node = _get_docstr_node(node)
+        if docstr_node is None:
+            yield types_.Problem(node.lineno, node.col_offset, DOCSTR_MISSING_MSG)
+        else:
+            is_private = _PRIVATE_FUNCTION_PATTERN.match(node.name) is not None
+            # Check args
+            docstr_info = _parse_docstr(docstr_node)
+            yield from args.check(
+                docstr_info,
+                docstr_node,
+                node.args,
+                is_private,
+            )
 
-            if (
-                node.body
-                and isinstance(node.body[0], ast.Expr)
-                and isinstance(node.body[0].value, ast.Constant)
-                and isinstance(node.body[0].value.value, str)
-            ):
-                is_private = bool(re.match(PRIVATE_FUNCTION_PATTERN, node.name))
-                # Check args
-                docstr_info = docstring.parse(value=node.body[0].value.value)
-                docstr_node = node.body[0].value
-                self.problems.extend(
-                    args.check(
-                        docstr_info=docstr_info,
-                        docstr_node=docstr_node,
-                        args=node.args,
-                        is_private=is_private,
-                    )
-                )
+            # Check returns
+            yield from _check_returns(
+                docstr_info,
+                docstr_node,
+                function_nodes.return_nodes,
+                is_private,
+            )
 
-                # Check returns
-                visitor_within_function = VisitorWithinFunction()
-                visitor_within_function.visit(node=node)
-                self.problems.extend(
-                    _check_returns(
-                        docstr_info=docstr_info,
-                        docstr_node=docstr_node,
-                        return_nodes=visitor_within_function.return_nodes,
-                        is_private=is_private,
-                    )
-                )
+            # Check yields
+            yield from _check_yields(
+                docstr_info,
+                docstr_node,
+                function_nodes.yield_nodes,
+                is_private,
+            )
 
-                # Check yields
-                self.problems.extend(
-                    _check_yields(
-                        docstr_info=docstr_info,
-                        docstr_node=docstr_node,
-                        yield_nodes=visitor_within_function.yield_nodes,
-                        is_private=is_private,
-                    )
-                )
+            # Check raises
+            yield from raises.check(
+                docstr_info,
+                docstr_node,
+                function_nodes.raise_nodes,
+                is_private,
+            )
 
-                # Check raises
-                self.problems.extend(
-                    raises.check(
-                        docstr_info=docstr_info,
-                        docstr_node=docstr_node,
-                        raise_nodes=visitor_within_function.raise_nodes,
-                        is_private=is_private,
-                    )
-                )
+    def visit_any_function(self, node: ast.FunctionDef | ast.AsyncFunctionDef) -> None:
+        """Record the nodes within a function definition node and check it.
 
-        # Ensure recursion continues
+        Args:
+            node: The function definition to check.
+        """
+        # Ensure recursion continues, the nodes within skipped functions are not recorded
+        if self._skip_function(node=node):
+            self._function_nodes.append(None)
+            self.generic_visit(node)
+            self._function_nodes.pop()
+            return
+
+        # The problems of the function are reported before those of any nested functions
+        problems_index = len(self.problems)
+
+        # Ensure recursion continues, recording the nodes within the function
+        function_nodes = _FunctionNodes(return_nodes=[], yield_nodes=[], raise_nodes=[])
+        self._function_nodes.append(function_nodes)
         self.generic_visit(node)
+        self._function_nodes.pop()
 
-    # The functions must be called the same as the name of the node
-    visit_FunctionDef = visit_any_function  # noqa: N815,DCO063
-    visit_AsyncFunctionDef = visit_any_function  # noqa: N815,DCO063
+        self.problems[problems_index:problems_index] = self._check_function(
+            node=node, function_nodes=function_nodes
+        )
 
-    # The function must be called the same as the name of the node
-    def visit_ClassDef(self, node: ast.ClassDef) -> None:  # pylint: disable=invalid-name
+    def visit_class(self, node: ast.ClassDef) -> None:
         """Check a class definition node.
 
         Args:
             node: The class definition to check.
         """
         # Check docstring is defined
-        if ast.get_docstring(node) is None:
-            self.problems.append(
-                types_.Problem(
-                    lineno=node.lineno, col_offset=node.col_offset, msg=DOCSTR_MISSING_MSG
-                )
-            )
-
-        if (
-            node.body
-            and isinstance(node.body[0], ast.Expr)
-            and isinstance(node.body[0].value, ast.Constant)
-            and isinstance(node.body[0].value.value, str)
-        ):
+        docstr_node = _get_docstr_node(node)
+        if docstr_node is None:
+            self.problems.append(types_.Problem(node.lineno, node.col_offset, DOCSTR_MISSING_MSG))
+        else:
             # Check attrs
-            docstr_info = docstring.parse(value=node.body[0].value.value)
-            docstr_node = node.body[0].value
+            docstr_info = _parse_docstr(docstr_node)
             visitor_within_class = attrs.VisitorWithinClass()
             visitor_within_class.visit(node=node)
             self.problems.extend(
                 attrs.check(
-                    docstr_info=docstr_info,
-                    docstr_node=docstr_node,
-                    class_assign_nodes=visitor_within_class.class_assign_nodes,
-                    method_assign_nodes=visitor_within_class.method_assign_nodes,
+                    docstr_info,
+                    docstr_node,
+                    visitor_within_class.class_assign_nodes,
+                    visitor_within_class.method_assign_nodes,
                 )
             )
 
+        # Ensure recursion continues, nodes within the class are not part of any function
+        self._function_nodes.append(None)
+        self.generic_visit(node)
+        self._function_nodes.pop()
+
+    def visit_return(self, node: ast.Return) -> None:
+        """Record return node.
+
+        Args:
+            node: The return node to record.
+        """
+        function_nodes = self._function_nodes[-1]
+        if function_nodes is not None:
+            function_nodes.return_nodes.append(node)
+
+        # Ensure recursion continues
+        self.generic_visit(node)
+
+    def visit_yield(self, node: ast.Yield) -> None:
+        """Record yield node.
+
+        Args:
+            node: The yield node to record.
+        """
+        # Yields are expressions, which are only visited within functions that are not skipped
+        cast(_FunctionNodes, self._function_nodes[-1]).yield_nodes.append(node)
+
         # Ensure recursion continues
         self.generic_visit(node)
 
+    def visit_yield_from(self, node: ast.YieldFrom) -> None:
+        """Record yield from node.
+
+        Args:
+            node: The yield from node to record.
+        """
+        # Yields are expressions, which are only visited within functions that are not skipped
+        cast(_FunctionNodes, self._function_nodes[-1]).yield_nodes.append(node)
+
+        # Ensure recursion continues
+        self.generic_visit(node)
+
+    def visit_raise(self, node: ast.Raise) -> None:
+        """Record raise node.
+
+        Args:
+            node: The raise node to record.
+        """
+        function_nodes = self._function_nodes[-1]
+        if function_nodes is not None:
+            function_nodes.raise_nodes.append(node)
+
+        # Ensure recursion continues
+        self.generic_visit(node)
+
+    # visit dispatches on the type of the node through this table rather than looking up the visit
+    # method by the name of the node, most nodes do not have a visit method
+    _node_visitors: dict[type[ast.AST], Callable[[Visitor, Any], None]] = {
+        ast.FunctionDef: visit_any_function,
+        ast.AsyncFunctionDef: visit_any_function,
+        ast.ClassDef: visit_class,
+        ast.Return: visit_return,
+        ast.Yield: visit_yield,
+        ast.YieldFrom: visit_yield_from,
+        ast.Raise: visit_raise,
+    }
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the children of a node except for those that cannot contain nodes to visit.
+
+        Args:
+            node: The node to visit the children of.
+        """
+        # Outside of functions there are no nodes to record, only the nested functions and classes
+        # need to be visited and those can only be within statements
+        if self._function_nodes[-1] is None:
+            for field in STATEMENT_FIELDS:
+                for child in getattr(node, field, ()):
+                    self.visit(child)
+            return
+
+        # Same iteration as ast.NodeVisitor.generic_visit, the leaf nodes are skipped before the
+        # visit call
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, ast.AST) and type(item) not in _LEAF_NODE_TYPES:
+                        self.visit(item)
+            elif isinstance(value, ast.AST) and type(value) not in _LEAF_NODE_TYPES:
+                self.visit(value)
+
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node.
+
+        Args:
+            node: The node to visit.
+        """
+        node_visitor = self._node_visitors.get(type(node))
+        if node_visitor is None:
+            self.generic_visit(node)
+        else:
+            node_visitor(self, node)
+
 
 class Plugin:
     """Checks docstring include all expected descriptions.
@@ -478,10 +600,12 @@ class Plugin:
     """
 
     name = __name__
-    _test_filename_pattern: str = TEST_FILENAME_PATTERN_DEFAULT
-    _test_function_pattern: str = TEST_FUNCTION_PATTERN_DEFAULT
-    _fixture_filename_pattern: str = FIXTURE_FILENAME_PATTERN_DEFAULT
-    _fixture_decorator_pattern: str = FIXTURE_DECORATOR_PATTERN_DEFAULT
+    _test_filename_pattern: re.Pattern[str] = re.compile(TEST_FILENAME_PATTERN_DEFAULT)
+    _test_function_pattern: re.Pattern[str] = re.compile(TEST_FUNCTION_PATTERN_DEFAULT)
+    _fixture_filename_pattern: re.Pattern[str] = re.compile(FIXTURE_FILENAME_PATTERN_DEFAULT)
+    _fixture_decorator_pattern: re.Pattern[str] = re.compile(
+        FIXTURE_DECORATOR_PATTERN_DEFAULT, re.IGNORECASE
+    )
     _tree: ast.AST
     _filename: str
 
@@ -493,7 +617,7 @@ class Plugin:
             filename: The name of the file being processed.
         """
         self._tree = tree
-        self._filename = Path(filename).name
+        self._filename = os.path.basename(filename)
 
     def _get_file_type(self) -> types_.FileType:
         """Get the file type from a filename.
@@ -501,10 +625,10 @@ class Plugin:
         Returns:
             The type of file.
         """
-        if re.match(self._test_filename_pattern, self._filename) is not None:
+        if self._test_filename_pattern.match(self._filename) is not None:
             return types_.FileType.TEST
 
-        if re.match(self._fixture_filename_pattern, self._filename) is not None:
+        if self._fixture_filename_pattern.match(self._filename) is not None:
             return types_.FileType.FIXTURE
 
         return types_.FileType.DEFAULT
@@ -562,21 +686,21 @@ class Plugin:
         Args:
             options: The options passed to flake8.
         """
-        cls._test_filename_pattern = (
-            getattr(options, _cli_arg_name_to_attr(TEST_FILENAME_PATTERN_ARG_NAME), None)
-            or TEST_FILENAME_PATTERN_DEFAULT
+        # The patterns are compiled once here rather than on every match
+        cls._test_filename_pattern = re.compile(
+            getattr(options, _TEST_FILENAME_PATTERN_ATTR, None) or TEST_FILENAME_PATTERN_DEFAULT
         )
-        cls._test_function_pattern = (
-            getattr(options, _cli_arg_name_to_attr(TEST_FUNCTION_PATTERN_ARG_NAME), None)
-            or TEST_FUNCTION_PATTERN_DEFAULT
+        cls._test_function_pattern = re.compile(
+            getattr(options, _TEST_FUNCTION_PATTERN_ATTR, None) or TEST_FUNCTION_PATTERN_DEFAULT
         )
-        cls._fixture_filename_pattern = (
-            getattr(options, _cli_arg_name_to_attr(FIXTURE_FILENAME_PATTERN_ARG_NAME), None)
+        cls._fixture_filename_pattern = re.compile(
+            getattr(options, _FIXTURE_FILENAME_PATTERN_ATTR, None)
             or FIXTURE_FILENAME_PATTERN_DEFAULT
         )
-        cls._fixture_decorator_pattern = (
-            getattr(options, _cli_arg_name_to_attr(FIXTURE_DECORATOR_PATTERN_ARG_NAME), None)
-            or FIXTURE_DECORATOR_PATTERN_DEFAULT
+        cls._fixture_decorator_pattern = re.compile(
+            getattr(options, _FIXTURE_DECORATOR_PATTERN_ATTR, None)
+            or FIXTURE_DECORATOR_PATTERN_DEFAULT,
+            re.IGNORECASE,
         )
 
     def run(self) -> Iterator[tuple[int, int, str, type["Plugin"]]]:
@@ -592,7 +716,8 @@ class Plugin:
             fixture_decorator_pattern=self._fixture_decorator_pattern,
         )
         visitor.visit(node=self._tree)
+        # Problems are tuples, unpacking them avoids the attribute lookups by name
+        plugin_type = type(self)
         yield from (
-            (problem.lineno, problem.col_offset, problem.msg, type(self))
-            for problem in visitor.problems
+            (lineno, col_offset, msg, plugin_type) for lineno, col_offset, msg in visitor.problems
         )
@@ -7,7 +7,7 @@ from collections import Counter
 from typing import Iterator
 
 from . import docstring, types_
-from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE
+from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE, split_msg
 
 ARGS_SECTION_NOT_IN_DOCSTR_CODE = f"{ERROR_CODE_PREFIX}020"
 ARGS_SECTION_NOT_IN_DOCSTR_MSG = (
@@ -41,29 +41,35 @@ DUPLICATE_ARG_MSG = (
     f'{DUPLICATE_ARG_CODE} "%s" argument documented multiple times{MORE_INFO_BASE}'
     f"{DUPLICATE_ARG_CODE.lower()}"
 )
+_MULT_ARGS_PREFIX, _MULT_ARGS_SUFFIX = split_msg(MULT_ARGS_SECTIONS_IN_DOCSTR_MSG)
+_ARG_NOT_IN_PREFIX, _ARG_NOT_IN_SUFFIX = split_msg(ARG_NOT_IN_DOCSTR_MSG)
+_ARG_IN_PREFIX, _ARG_IN_SUFFIX = split_msg(ARG_IN_DOCSTR_MSG)
+_DUPLICATE_ARG_PREFIX, _DUPLICATE_ARG_SUFFIX = split_msg(DUPLICATE_ARG_MSG)
 
 SKIP_ARGS = {"self", "cls"}
 UNUSED_ARGS_PREFIX = "_"
 
 
-def _iter_args(args: ast.arguments) -> Iterator[ast.arg]:
-    """Iterate over all arguments.
+def _get_args(args: ast.arguments) -> list[ast.arg]:
+    """Get all arguments.
 
     Adds vararg and kwarg to the args.
 
     Args:
-        args: The arguments to iter over.
+        args: The arguments to get.
 
-    Yields:
+    Returns:
         All the arguments.
     """
-    yield from (arg for arg in args.args if arg.arg not in SKIP_ARGS)
-    yield from (arg for arg in args.posonlyargs if arg.arg not in SKIP_ARGS)
-    yield from (arg for arg in args.kwonlyargs)
+    all_args = [arg for arg in args.args if arg.arg not in SKIP_ARGS]
+    if args.posonlyargs:
+        all_args.extend([arg for arg in args.posonlyargs if arg.arg not in SKIP_ARGS])
+    all_args.extend(args.kwonlyargs)
     if args.vararg:
-        yield args.vararg
+        all_args.append(args.vararg)
     if args.kwarg:
-        yield args.kwarg
+        all_args.append(args.kwarg)
+    return all_args
 
 
 def check(
@@ -88,56 +94,69 @@ def check(
     Yields:
         All the problems with the arguments.
     """
-    all_args = list(_iter_args(args))
-    all_used_args = list(arg for arg in all_args if not arg.arg.startswith(UNUSED_ARGS_PREFIX))
+    all_args = _get_args(args)
+
+    # Without an args section the only possible problem is that the section is missing
+    if docstr_info.args is None:
+        # Check that args section is in docstring if function/ method has used arguments
+        if not is_private and any(not arg.arg.startswith(UNUSED_ARGS_PREFIX) for arg in all_args):
+            yield types_.Problem(
+                docstr_node.lineno, docstr_node.col_offset, ARGS_SECTION_NOT_IN_DOCSTR_MSG
+            )
+        return
 
-    # Check that args section is in docstring if function/ method has used arguments
-    if all_used_args and docstr_info.args is None and not is_private:
-        yield types_.Problem(
-            docstr_node.lineno, docstr_node.col_offset, ARGS_SECTION_NOT_IN_DOCSTR_MSG
-        )
     # Check that args section is not in docstring if function/ method has no arguments
-    if not all_args and docstr_info.args is not None:
+    if not all_args:
         yield types_.Problem(
             docstr_node.lineno, docstr_node.col_offset, ARGS_SECTION_IN_DOCSTR_MSG
         )
+        return
 
     # Checks for function with arguments and args section
-    if all_args and docstr_info.args is not None:
-        docstr_args = set(docstr_info.args)
+    all_used_args = [arg for arg in all_args if not arg.arg.startswith(UNUSED_ARGS_PREFIX)]
+
+    # Check for multiple args sections
+    if len(docstr_info.args_sections) > 1:
+        yield types_.Problem(
+            docstr_node.lineno,
+            docstr_node.col_offset,
+            _MULT_ARGS_PREFIX + ",".join(docstr_info.args_sections) + _MULT_ARGS_SUFFIX,
+        )
 
-        # Check for multiple args sections
-        if len(docstr_info.args_sections) > 1:
+    docstr_args = set(docstr_info.args)
+
+    # Check for function arguments that are not in the docstring
+    for arg in all_used_args:
+        if arg.arg not in docstr_args:
+            yield types_.Problem(
+                arg.lineno, arg.col_offset, _ARG_NOT_IN_PREFIX + arg.arg + _ARG_NOT_IN_SUFFIX
+            )
+
+    # Check for arguments in the docstring that are not function arguments
+    func_args = {arg.arg for arg in all_args}
+    extra_docstr_args = docstr_args - func_args
+    if extra_docstr_args:
+        for arg_name in sorted(extra_docstr_args):
             yield types_.Problem(
                 docstr_node.lineno,
                 docstr_node.col_offset,
-                MULT_ARGS_SECTIONS_IN_DOCSTR_MSG % ",".join(docstr_info.args_sections),
+                _ARG_IN_PREFIX + arg_name + _ARG_IN_SUFFIX,
             )
 
-        # Check for function arguments that are not in the docstring
+    # Check for duplicate arguments, only counted if there are any
+    if len(docstr_args) != len(docstr_info.args):
         yield from (
-            types_.Problem(arg.lineno, arg.col_offset, ARG_NOT_IN_DOCSTR_MSG % arg.arg)
-            for arg in all_used_args
-            if arg.arg not in docstr_args
-        )
-
-        # Check for arguments in the docstring that are not function arguments
-        func_args = set(arg.arg for arg in all_args)
-        yield from (
-            types_.Problem(docstr_node.lineno, docstr_node.col_offset, ARG_IN_DOCSTR_MSG % arg)
-            for arg in sorted(docstr_args - func_args)
-        )
-
-        # Check for duplicate arguments
-        arg_occurrences = Counter(docstr_info.args)
-        yield from (
-            types_.Problem(docstr_node.lineno, docstr_node.col_offset, DUPLICATE_ARG_MSG % arg)
-            for arg, occurrences in arg_occurrences.items()
+            types_.Problem(
+                docstr_node.lineno,
+                docstr_node.col_offset,
+                _DUPLICATE_ARG_PREFIX + arg_name + _DUPLICATE_ARG_SUFFIX,
+            )
+            for arg_name, occurrences in Counter(docstr_info.args).items()
             if occurrences > 1
         )
 
-        # Check for empty args section
-        if not all_used_args and len(docstr_info.args) == 0:
-            yield types_.Problem(
-                docstr_node.lineno, docstr_node.col_offset, ARGS_SECTION_IN_DOCSTR_MSG
-            )
+    # Check for empty args section
+    if not all_used_args and len(docstr_info.args) == 0:
+        yield types_.Problem(
+            docstr_node.lineno, docstr_node.col_offset, ARGS_SECTION_IN_DOCSTR_MSG
+        )
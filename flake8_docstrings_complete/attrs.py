@@ -4,11 +4,10 @@ from __future__ import annotations
 
 import ast
 from collections import Counter
-from itertools import chain
-from typing import Iterable, Iterator
+from typing import Any, Callable, Iterable, Iterator, cast
 
 from . import docstring, types_
-from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE
+from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE, STATEMENT_FIELDS, split_msg
 
 ATTRS_SECTION_NOT_IN_DOCSTR_CODE = f"{ERROR_CODE_PREFIX}060"
 ATTRS_SECTION_NOT_IN_DOCSTR_MSG = (
@@ -40,10 +39,21 @@ DUPLICATE_ATTR_MSG = (
     f'{DUPLICATE_ATTR_CODE} "%s" attribute documented multiple times{MORE_INFO_BASE}'
     f"{DUPLICATE_ATTR_CODE.lower()}"
 )
+_MULT_ATTRS_PREFIX, _MULT_ATTRS_SUFFIX = split_msg(MULT_ATTRS_SECTIONS_IN_DOCSTR_MSG)
+_ATTR_NOT_IN_PREFIX, _ATTR_NOT_IN_SUFFIX = split_msg(ATTR_NOT_IN_DOCSTR_MSG)
+_ATTR_IN_PREFIX, _ATTR_IN_SUFFIX = split_msg(ATTR_IN_DOCSTR_MSG)
+_DUPLICATE_ATTR_PREFIX, _DUPLICATE_ATTR_SUFFIX = split_msg(DUPLICATE_ATTR_MSG)
 
 CLASS_SELF_CLS = {"self", "cls"}
 PRIVATE_ATTR_PREFIX = "_"
 
+# Module level references to the node types checked for every decorator and assignment, avoids
+# the repeated attribute lookup on the ast module
+_Assign = ast.Assign
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Name = ast.Name
+
 
 def is_property_decorator(node: ast.expr) -> bool:
     """Determine whether an expression is a property decorator.
@@ -54,21 +64,17 @@ def is_property_decorator(node: ast.expr) -> bool:
     Returns:
         Whether the node is a property decorator.
     """
-    if isinstance(node, ast.Name):
+    if type(node) is _Name:
         return node.id in {"property", "cached_property"}
 
     # Handle call
-    if isinstance(node, ast.Call):
+    if type(node) is _Call:
         return is_property_decorator(node=node.func)
 
     # Handle attr
-    if isinstance(node, ast.Attribute):
+    if type(node) is _Attribute:
         value = node.value
-        return (
-            node.attr == "cached_property"
-            and isinstance(value, ast.Name)
-            and value.id == "functools"
-        )
+        return node.attr == "cached_property" and type(value) is _Name and value.id == "functools"
 
     # There is no valid syntax that gets to here
     return False  # pragma: nocover
@@ -83,16 +89,14 @@ def _get_class_target_name(target: ast.expr) -> ast.Name | None:
     Returns:
         The Name node of the target.
     """
-    if isinstance(target, ast.Name):
+    # Follow the attribute chain to the name it starts with
+    while type(target) is _Attribute:
+        target = target.value
+    if type(target) is _Name:
         return target
-    if isinstance(target, ast.Attribute):
-        if isinstance(target.value, ast.Name):
-            return target.value
-        if isinstance(target.value, ast.Attribute):
-            return _get_class_target_name(target=target.value)
 
-    # There is no valid syntax that gets to here
-    return None  # pragma: nocover
+    # Targets that are neither names nor attributes, such as tuples, have no single name
+    return None
 
 
 def _iter_class_attrs(
@@ -107,18 +111,20 @@ def _iter_class_attrs(
         All the nodes of name targets of the assignment expressions.
     """
     for node in nodes:
-        if isinstance(node, types_.Node):
+        if type(node) is types_.Node:
             yield node
-        elif isinstance(node, ast.Assign):
-            target_names = filter(
-                None, (_get_class_target_name(target) for target in node.targets)
-            )
-            yield from (
-                types_.Node(lineno=name.lineno, col_offset=name.col_offset, name=name.id)
-                for name in target_names
-            )
+        elif type(node) is _Assign:
+            for target in node.targets:
+                # Most targets are names, only attributes need to be followed to their name
+                name = target if type(target) is _Name else _get_class_target_name(target)
+                # Targets that unpack into multiple names, such as tuples, are not attributes
+                if name is not None:
+                    yield types_.Node(lineno=name.lineno, col_offset=name.col_offset, name=name.id)
         else:
-            target_name = _get_class_target_name(target=node.target)
+            # Only annotated and augmented assignments remain, both have a single target
+            target_name = _get_class_target_name(
+                target=cast("ast.AnnAssign | ast.AugAssign", node).target
+            )
             # No valid syntax reaches else
             if target_name is not None:  # pragma: nobranch
                 yield types_.Node(
@@ -137,14 +143,13 @@ def _get_method_target_node(target: ast.expr) -> types_.Node | None:
     Returns:
         The Name node of the target.
     """
-    if isinstance(target, ast.Attribute):
-        if isinstance(target.value, ast.Name) and target.value.id in CLASS_SELF_CLS:
+    # Follow the attribute chain to the attribute directly on self or cls
+    while type(target) is _Attribute:
+        if type(target.value) is _Name and target.value.id in CLASS_SELF_CLS:
             return types_.Node(
                 lineno=target.lineno, col_offset=target.col_offset, name=target.attr
             )
-        # No valid syntax reaches else
-        if isinstance(target.value, ast.Attribute):  # pragma: nobranch
-            return _get_method_target_node(target=target.value)
+        target = target.value
 
     return None
 
@@ -161,10 +166,13 @@ def _iter_method_attrs(
         All the nodes of name targets of the assignment expressions in methods.
     """
     for node in nodes:
-        if isinstance(node, ast.Assign):
+        if type(node) is _Assign:
             yield from filter(None, (_get_method_target_node(target) for target in node.targets))
         else:
-            target_node = _get_method_target_node(node.target)
+            # Only annotated and augmented assignments remain, both have a single target
+            target_node = _get_method_target_node(
+                cast("ast.AnnAssign | ast.AugAssign", node).target
+            )
             # No valid syntax reaches else
             if target_node is not None:  # pragma: nobranch
                 yield target_node
@@ -191,11 +199,12 @@ def check(
     Yields:
         All the problems with the attributes.
     """
-    all_class_targets = list(_iter_class_attrs(class_assign_nodes))
-    all_public_class_targets = list(
-        target for target in all_class_targets if not target.name.startswith(PRIVATE_ATTR_PREFIX)
-    )
-    all_targets = list(chain(all_class_targets, _iter_method_attrs(method_assign_nodes)))
+    # The class targets are first, the method targets are added after the public ones are found
+    all_targets = list(_iter_class_attrs(class_assign_nodes))
+    all_public_class_targets = [
+        target for target in all_targets if not target.name.startswith(PRIVATE_ATTR_PREFIX)
+    ]
+    all_targets.extend(_iter_method_attrs(method_assign_nodes))
 
     # Check that attrs section is in docstring if function/ method has public attributes
     if all_public_class_targets and docstr_info.attrs is None:
@@ -218,30 +227,44 @@ def check(
             yield types_.Problem(
                 docstr_node.lineno,
                 docstr_node.col_offset,
-                MULT_ATTRS_SECTIONS_IN_DOCSTR_MSG % ",".join(docstr_info.attrs_sections),
+                _MULT_ATTRS_PREFIX + ",".join(docstr_info.attrs_sections) + _MULT_ATTRS_SUFFIX,
             )
 
         # Check for class attributes that are not in the docstring
         yield from (
-            types_.Problem(target.lineno, target.col_offset, ATTR_NOT_IN_DOCSTR_MSG % target.name)
+            types_.Problem(
+                target.lineno,
+                target.col_offset,
+                _ATTR_NOT_IN_PREFIX + target.name + _ATTR_NOT_IN_SUFFIX,
+            )
             for target in all_public_class_targets
             if target.name not in docstr_attrs
         )
 
         # Check for attributes in the docstring that are not class attributes
-        class_attrs = set(target.name for target in all_targets)
-        yield from (
-            types_.Problem(docstr_node.lineno, docstr_node.col_offset, ATTR_IN_DOCSTR_MSG % attr)
-            for attr in sorted(docstr_attrs - class_attrs)
-        )
+        class_attrs = {target.name for target in all_targets}
+        extra_docstr_attrs = docstr_attrs - class_attrs
+        if extra_docstr_attrs:
+            yield from (
+                types_.Problem(
+                    docstr_node.lineno,
+                    docstr_node.col_offset,
+                    _ATTR_IN_PREFIX + attr + _ATTR_IN_SUFFIX,
+                )
+                for attr in sorted(extra_docstr_attrs)
+            )
 
-        # Check for duplicate attributes
-        attr_occurrences = Counter(docstr_info.attrs)
-        yield from (
-            types_.Problem(docstr_node.lineno, docstr_node.col_offset, DUPLICATE_ATTR_MSG % attr)
-            for attr, occurrences in attr_occurrences.items()
-            if occurrences > 1
-        )
+        # Check for duplicate attributes, only counted if there are any
+        if len(docstr_attrs) != len(docstr_info.attrs):
+            yield from (
+                types_.Problem(
+                    docstr_node.lineno,
+                    docstr_node.col_offset,
+                    _DUPLICATE_ATTR_PREFIX + attr + _DUPLICATE_ATTR_SUFFIX,
+                )
+                for attr, occurrences in Counter(docstr_info.attrs).items()
+                if occurrences > 1
+            )
 
         # Check for empty attrs section
         if not all_public_class_targets and len(docstr_info.attrs) == 0:
@@ -317,12 +340,39 @@ class VisitorWithinClass(ast.NodeVisitor):
             self.generic_visit(node=node)
             self._visited_top_level = False
 
-    # The functions must be called the same as the name of the node
-    # Visit assign nodes
-    visit_Assign = visit_assign  # noqa: N815,DCO063
-    visit_AnnAssign = visit_assign  # noqa: N815,DCO063
-    visit_AugAssign = visit_assign  # noqa: N815,DCO063
-    # Ensure that nested functions and classes are not iterated over
-    visit_FunctionDef = visit_any_function  # noqa: N815,DCO063
-    visit_AsyncFunctionDef = visit_any_function  # noqa: N815,DCO063
-    visit_ClassDef = visit_once  # noqa: N815,DCO063
+    # visit dispatches on the type of the node through this table rather than looking up the visit
+    # method by the name of the node, visiting nested functions and classes only once ensures they
+    # are not iterated over
+    _node_visitors: dict[type[ast.AST], Callable[[VisitorWithinClass, Any], None]] = {
+        ast.Assign: visit_assign,
+        ast.AnnAssign: visit_assign,
+        ast.AugAssign: visit_assign,
+        ast.FunctionDef: visit_any_function,
+        ast.AsyncFunctionDef: visit_any_function,
+        ast.ClassDef: visit_once,
+    }
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit the statements within a node.
+
+        Args:
+            node: The node to visit the statements of.
+        """
+        # The assignments, functions and classes are all statements, the expressions do not need
+        # to be visited
+        for field in STATEMENT_FIELDS:
+            for child in getattr(node, field, ()):
+                self.visit(child)
+
+    def visit(self, node: ast.AST) -> None:
+        """Visit a node.
+
+        Args:
+            node: The node to visit.
+        """
+        node_visitor = self._node_visitors.get(type(node))
+        if node_visitor is not None:
+            node_visitor(self, node)
+        else:
+            # Nodes without a visit method only need their statements visited
+            self.generic_visit(node)
@@ -1,6 +1,25 @@
-"""Shared constants for the linter."""
+"""Shared constants and message helpers for the linter."""
 
 ERROR_CODE_PREFIX = "DCO"
 MORE_INFO_BASE = (
     ", more information: https://github.com/jdkandersson/flake8-docstrings-complete#fix-"
 )
+
+# The fields of nodes that contain statements in the order they are defined on the nodes
+STATEMENT_FIELDS = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def split_msg(msg: str) -> tuple[str, str]:
+    """Split a message around its %s placeholder.
+
+    Concatenating the value between the prefix and suffix is cheaper than % formatting the message
+    for every problem.
+
+    Args:
+        msg: The message with a single %s placeholder.
+
+    Returns:
+        The part of the message before and after the placeholder.
+    """
+    prefix, suffix = msg.split("%s")
+    return prefix, suffix
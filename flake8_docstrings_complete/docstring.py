@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-import contextlib
-import itertools
+import functools
 import re
 from typing import Iterable, Iterator, NamedTuple
 
@@ -55,10 +54,19 @@ _SECTION_NAMES = {
     "yields": {"yield", "yields"},
     "raises": {"raises", "raise"},
 }
+# Maps each section name to its kind, including the common casings so that lowering the name is
+# only required for unusual casings
+_SECTION_KINDS = {
+    casing: kind
+    for kind, names in _SECTION_NAMES.items()
+    for name in names
+    for casing in (name, name.title(), name.upper())
+}
+# Shared by all the docstrings without any known sections, Docstring is immutable
+_EMPTY_DOCSTRING = Docstring()
 _WHITESPACE_REGEX = r"\s*"
 _SECTION_NAME_PATTERN = re.compile(rf"{_WHITESPACE_REGEX}(\w+):")
 _SUB_SECTION_PATTERN = re.compile(rf"{_WHITESPACE_REGEX}(\w+)( \(.*\))?:")
-_SECTION_END_PATTERN = re.compile(rf"{_WHITESPACE_REGEX}$")
 
 
 def _get_sections(lines: Iterable[str]) -> Iterator[_Section]:
@@ -77,66 +85,37 @@ def _get_sections(lines: Iterable[str]) -> Iterator[_Section]:
     Yields:
         All the sections in the docstring.
     """
-    lines = iter(lines)
-
-    with contextlib.suppress(StopIteration):
-        while True:
-            # Find the start of the next section
-            section_start = next(line for line in lines if line.strip())
-            section_name_match = _SECTION_NAME_PATTERN.match(section_start)
+    # Most lines are within sections, bind the method once for them
+    match_sub_section = _SUB_SECTION_PATTERN.match
+    section_name: str | None = None
+    # None when the lines are between sections
+    sub_sections: list[str] | None = None
+
+    for line in lines:
+        if not line.strip():
+            # A blank line ends the current section, if any
+            if sub_sections is not None:
+                yield _Section(name=section_name, subs=tuple(sub_sections))
+                sub_sections = None
+        elif sub_sections is None:
+            # Start of the next section
+            section_name_match = _SECTION_NAME_PATTERN.match(line)
             section_name = section_name_match.group(1) if section_name_match else None
+            sub_sections = []
+        elif ":" in line:
+            # Retrieve sub section from section lines, lines without a colon can't be a sub section
+            sub_section_match = match_sub_section(line)
+            if sub_section_match is not None:
+                sub_sections.append(sub_section_match.group(1))
 
-            # Get all the lines of the section
-            section_lines = itertools.takewhile(
-                lambda line: _SECTION_END_PATTERN.match(line) is None, lines
-            )
-
-            # Retrieve sub section from section lines
-            sub_section_matches = (_SUB_SECTION_PATTERN.match(line) for line in section_lines)
-            sub_sections = (match.group(1) for match in sub_section_matches if match is not None)
-
-            yield _Section(name=section_name, subs=tuple(sub_sections))
-
-
-def _get_section_by_name(name: str, sections: Iterable[_Section]) -> _Section | None:
-    """Get the section by name.
-
-    Args:
-        name: The name of the section.
-        sections: The sections to retrieve from.
-
-    Returns:
-        The section or None if it wasn't found.
-    """
-    sections = iter(sections)
-    return next(
-        (
-            section
-            for section in sections
-            if section.name is not None and section.name.lower() in _SECTION_NAMES[name]
-        ),
-        None,
-    )
-
-
-def _get_all_section_names_by_name(name: str, sections: Iterable[_Section]) -> Iterator[str]:
-    """Get all the section names in a docstring by name.
-
-    Args:
-        name: The name of the section.
-        sections: The sections to retrieve from.
-
-    Yields:
-        The names of the sections that match the name.
-    """
-    sections = iter(sections)
-    yield from (
-        section.name
-        for section in sections
-        if section.name is not None and section.name.lower() in _SECTION_NAMES[name]
-    )
+    # The last section ends with the docstring
+    if sub_sections is not None:
+        yield _Section(name=section_name, subs=tuple(sub_sections))
 
 
+# Identical docstrings are common, for example on overridden methods, the cached result can be
+# shared since Docstring is immutable
+@functools.lru_cache(maxsize=1024)
 def parse(value: str) -> Docstring:
     """Parse a docstring.
 
@@ -146,19 +125,33 @@ def parse(value: str) -> Docstring:
     Returns:
         The parsed docstring.
     """
-    sections = list(_get_sections(lines=value.splitlines()))
-
-    args_section = _get_section_by_name("args", sections)
-    attrs_section = _get_section_by_name("attrs", sections)
-    raises_section = _get_section_by_name("raises", sections)
+    # Every section starts with a word followed by a colon, without one the docstring has no
+    # sections to look for
+    if ":" not in value:
+        return _EMPTY_DOCSTRING
+
+    # The names of the sections and the sub-sections of the first section of each kind
+    section_names: dict[str, list[str]] = {}
+    section_subs: dict[str, tuple[str, ...]] = {}
+    for section in _get_sections(lines=value.splitlines()):
+        if section.name is None:
+            continue
+        kind = _SECTION_KINDS.get(section.name) or _SECTION_KINDS.get(section.name.lower())
+        if kind is None:
+            continue
+        section_names.setdefault(kind, []).append(section.name)
+        section_subs.setdefault(kind, section.subs)
+
+    if not section_names:
+        return _EMPTY_DOCSTRING
 
     return Docstring(
-        args=args_section.subs if args_section is not None else None,
-        args_sections=tuple(_get_all_section_names_by_name(name="args", sections=sections)),
-        attrs=attrs_section.subs if attrs_section is not None else None,
-        attrs_sections=tuple(_get_all_section_names_by_name(name="attrs", sections=sections)),
-        returns_sections=tuple(_get_all_section_names_by_name(name="returns", sections=sections)),
-        yields_sections=tuple(_get_all_section_names_by_name(name="yields", sections=sections)),
-        raises=raises_section.subs if raises_section is not None else None,
-        raises_sections=tuple(_get_all_section_names_by_name(name="raises", sections=sections)),
+        args=section_subs.get("args"),
+        args_sections=tuple(section_names.get("args", ())),
+        attrs=section_subs.get("attrs"),
+        attrs_sections=tuple(section_names.get("attrs", ())),
+        returns_sections=tuple(section_names.get("returns", ())),
+        yields_sections=tuple(section_names.get("yields", ())),
+        raises=section_subs.get("raises"),
+        raises_sections=tuple(section_names.get("raises", ())),
     )
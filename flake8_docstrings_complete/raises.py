@@ -7,7 +7,7 @@ from collections import Counter
 from typing import Iterable, Iterator
 
 from . import docstring, types_
-from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE
+from .constants import ERROR_CODE_PREFIX, MORE_INFO_BASE, split_msg
 
 RAISES_SECTION_NOT_IN_DOCSTR_CODE = f"{ERROR_CODE_PREFIX}050"
 RAISES_SECTION_NOT_IN_DOCSTR_MSG = (
@@ -48,6 +48,16 @@ DUPLICATE_EXC_MSG = (
     f'{DUPLICATE_EXC_CODE} "%s" exception documented multiple times{MORE_INFO_BASE}'
     f"{DUPLICATE_EXC_CODE.lower()}"
 )
+_MULT_RAISES_PREFIX, _MULT_RAISES_SUFFIX = split_msg(MULT_RAISES_SECTIONS_IN_DOCSTR_MSG)
+_EXC_NOT_IN_PREFIX, _EXC_NOT_IN_SUFFIX = split_msg(EXC_NOT_IN_DOCSTR_MSG)
+_EXC_IN_PREFIX, _EXC_IN_SUFFIX = split_msg(EXC_IN_DOCSTR_MSG)
+_DUPLICATE_EXC_PREFIX, _DUPLICATE_EXC_SUFFIX = split_msg(DUPLICATE_EXC_MSG)
+
+# Module level references to the node types checked for every raise, avoids the repeated attribute
+# lookup on the ast module
+_Attribute = ast.Attribute
+_Call = ast.Call
+_Name = ast.Name
 
 
 def _get_exc_node(node: ast.Raise) -> types_.Node | None:
@@ -59,27 +69,13 @@ def _get_exc_node(node: ast.Raise) -> types_.Node | None:
     Returns:
         The exception node.
     """
-    if isinstance(node.exc, ast.Name):
-        return types_.Node(
-            name=node.exc.id, lineno=node.exc.lineno, col_offset=node.exc.col_offset
-        )
-    if isinstance(node.exc, ast.Attribute):
-        return types_.Node(
-            name=node.exc.attr, lineno=node.exc.lineno, col_offset=node.exc.col_offset
-        )
-    if isinstance(node.exc, ast.Call):
-        if isinstance(node.exc.func, ast.Name):
-            return types_.Node(
-                name=node.exc.func.id,
-                lineno=node.exc.func.lineno,
-                col_offset=node.exc.func.col_offset,
-            )
-        if isinstance(node.exc.func, ast.Attribute):
-            return types_.Node(
-                name=node.exc.func.attr,
-                lineno=node.exc.func.lineno,
-                col_offset=node.exc.func.col_offset,
-            )
+    exc = node.exc
+    if type(exc) is _Call:
+        exc = exc.func
+    if type(exc) is _Name:
+        return types_.Node(name=exc.id, lineno=exc.lineno, col_offset=exc.col_offset)
+    if type(exc) is _Attribute:
+        return types_.Node(name=exc.attr, lineno=exc.lineno, col_offset=exc.col_offset)
 
     return None
 
@@ -105,9 +101,11 @@ def check(
     Yields:
         All the problems with exceptions.
     """
-    all_excs = list(_get_exc_node(node) for node in raise_nodes)
-    has_raise_no_value = any(exc is None for exc in all_excs)
-    all_raise_no_value = all(exc is None for exc in all_excs)
+    all_excs = [_get_exc_node(node) for node in raise_nodes]
+    # Raises without an exception, such as re-raises, have no exception node
+    exc_nodes = [exc for exc in all_excs if exc is not None]
+    has_raise_no_value = len(exc_nodes) != len(all_excs)
+    all_raise_no_value = not exc_nodes
 
     # Check that raises section is in docstring if function/ method raises exceptions
     if all_excs and docstr_info.raises is None and not is_private:
@@ -136,29 +134,40 @@ def check(
             yield types_.Problem(
                 docstr_node.lineno,
                 docstr_node.col_offset,
-                MULT_RAISES_SECTIONS_IN_DOCSTR_MSG % ",".join(docstr_info.raises_sections),
+                _MULT_RAISES_PREFIX + ",".join(docstr_info.raises_sections) + _MULT_RAISES_SUFFIX,
             )
 
         # Check for exceptions that are not raised
         yield from (
-            types_.Problem(exc.lineno, exc.col_offset, EXC_NOT_IN_DOCSTR_MSG % exc.name)
-            for exc in all_excs
-            if exc and exc.name not in docstr_raises
+            types_.Problem(
+                exc.lineno, exc.col_offset, _EXC_NOT_IN_PREFIX + exc.name + _EXC_NOT_IN_SUFFIX
+            )
+            for exc in exc_nodes
+            if exc.name not in docstr_raises
         )
 
-        # Check for duplicate exceptions in raises
-        exc_occurrences = Counter(docstr_info.raises)
-        yield from (
-            types_.Problem(docstr_node.lineno, docstr_node.col_offset, DUPLICATE_EXC_MSG % exc)
-            for exc, occurrences in exc_occurrences.items()
-            if occurrences > 1
-        )
+        # Check for duplicate exceptions in raises, only counted if there are any
+        if len(docstr_raises) != len(docstr_info.raises):
+            yield from (
+                types_.Problem(
+                    docstr_node.lineno,
+                    docstr_node.col_offset,
+                    _DUPLICATE_EXC_PREFIX + exc + _DUPLICATE_EXC_SUFFIX,
+                )
+                for exc, occurrences in Counter(docstr_info.raises).items()
+                if occurrences > 1
+            )
 
         # Check for exceptions in the docstring that are not raised unless function has a raises
         # without an exception
         if not has_raise_no_value:
-            func_exc = set(exc.name for exc in all_excs if exc is not None)
-            yield from (
-                types_.Problem(docstr_node.lineno, docstr_node.col_offset, EXC_IN_DOCSTR_MSG % exc)
-                for exc in sorted(docstr_raises - func_exc)
-            )
+            extra_docstr_raises = docstr_raises.difference(exc.name for exc in exc_nodes)
+            if extra_docstr_raises:
+                yield from (
+                    types_.Problem(
+                        docstr_node.lineno,
+                        docstr_node.col_offset,
+                        _EXC_IN_PREFIX + exc + _EXC_IN_SUFFIX,
+                    )
+                    for exc in sorted(extra_docstr_raises)
+                )
@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 
 import pytest
+from flake8.main.application import Application
 
 from flake8_docstrings_complete import (
     DOCSTR_MISSING_CODE,
@@ -24,6 +25,7 @@ from flake8_docstrings_complete import (
     TEST_FUNCTION_PATTERN_DEFAULT,
     YIELDS_SECTION_IN_DOCSTR_CODE,
     YIELDS_SECTION_NOT_IN_DOCSTR_CODE,
+    Plugin,
 )
 from flake8_docstrings_complete.args import (
     ARG_IN_DOCSTR_CODE,
@@ -59,22 +61,23 @@ def test_help():
     when: the flake8 help message is generated
     then: plugin is registered with flake8
     """
-    with subprocess.Popen(
-        f"{sys.executable} -m flake8 --help",
+    proc = subprocess.run(
+        [sys.executable, "-m", "flake8", "--help"],
         stdout=subprocess.PIPE,
-        shell=True,
-    ) as proc:
-        stdout = proc.communicate()[0].decode(encoding="utf-8")
+        check=False,
+        text=True,
+    )
 
-        assert "flake8-docstrings-complete" in stdout
-        assert TEST_FILENAME_PATTERN_ARG_NAME in stdout
-        assert TEST_FILENAME_PATTERN_DEFAULT in stdout
-        assert TEST_FUNCTION_PATTERN_ARG_NAME in stdout
-        assert TEST_FUNCTION_PATTERN_DEFAULT in stdout
-        assert FIXTURE_FILENAME_PATTERN_ARG_NAME in stdout
-        assert FIXTURE_FILENAME_PATTERN_DEFAULT in stdout
-        assert FIXTURE_DECORATOR_PATTERN_ARG_NAME in stdout
-        assert FIXTURE_DECORATOR_PATTERN_DEFAULT in stdout
+    stdout = proc.stdout
+    assert "flake8-docstrings-complete" in stdout
+    assert TEST_FILENAME_PATTERN_ARG_NAME in stdout
+    assert TEST_FILENAME_PATTERN_DEFAULT in stdout
+    assert TEST_FUNCTION_PATTERN_ARG_NAME in stdout
+    assert TEST_FUNCTION_PATTERN_DEFAULT in stdout
+    assert FIXTURE_FILENAME_PATTERN_ARG_NAME in stdout
+    assert FIXTURE_FILENAME_PATTERN_DEFAULT in stdout
+    assert FIXTURE_DECORATOR_PATTERN_ARG_NAME in stdout
+    assert FIXTURE_DECORATOR_PATTERN_DEFAULT in stdout
 
 
 def create_code_file(code: str, filename: str, base_path: Path) -> Path:
@@ -92,25 +95,53 @@ def create_code_file(code: str, filename: str, base_path: Path) -> Path:
     return code_file
 
 
-def test_fail(tmp_path: Path):
+# The class attributes of the plugin that are set when the options are parsed
+_PLUGIN_PATTERN_ATTRS = (
+    "_test_filename_pattern",
+    "_test_function_pattern",
+    "_fixture_filename_pattern",
+    "_fixture_decorator_pattern",
+)
+
+
+def run_flake8(args: list[str]) -> int:
+    """Run flake8 within the test process.
+
+    Avoids starting a new interpreter for every file that is linted, the problems are written to
+    stdout. Parsing the options sets the patterns on the plugin class, they are restored afterwards
+    so that the options don't leak into other tests.
+
+    Args:
+        args: The command line arguments for flake8.
+
+    Returns:
+        The exit code of flake8.
+    """
+    patterns = {name: getattr(Plugin, name) for name in _PLUGIN_PATTERN_ATTRS}
+    try:
+        app = Application()
+        app.run(args)
+        return app.exit_code()
+    finally:
+        for name, pattern in patterns.items():
+            setattr(Plugin, name, pattern)
+
+
+def test_fail(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
     """
     given: file with Python code that fails the linting
     when: flake8 is run against the code
-    then: the process exits with non-zero code and includes the error message
+    then: flake8 exits with non-zero code and includes the error message
     """
     code_file = create_code_file(
         '\ndef foo(arg_1):\n    """Docstring."""\n', "source.py", tmp_path
     )
 
-    with subprocess.Popen(
-        f"{sys.executable} -m flake8 {code_file}",
-        stdout=subprocess.PIPE,
-        shell=True,
-    ) as proc:
-        stdout = proc.communicate()[0].decode(encoding="utf-8")
+    returncode = run_flake8([str(code_file)])
 
-        assert ARGS_SECTION_NOT_IN_DOCSTR_MSG in stdout
-        assert proc.returncode
+    stdout = capsys.readouterr().out
+    assert ARGS_SECTION_NOT_IN_DOCSTR_MSG in stdout
+    assert returncode
 
 
 @pytest.mark.parametrize(
@@ -571,27 +602,31 @@ class Class1:
         ),
     ],
 )
-def test_pass(code: str, filename: str, extra_args: str, tmp_path: Path):
+def test_pass(
+    code: str, filename: str, extra_args: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
     """
     given: file with Python code that passes the linting
     when: flake8 is run against the code
-    then: the process exits with zero code and empty stdout
+    then: flake8 exits with zero code and empty stdout
     """
     code_file = create_code_file(code, filename, tmp_path)
     (config_file := tmp_path / ".flake8").touch()
 
-    with subprocess.Popen(
-        (
-            f"{sys.executable} -m flake8 {code_file} {extra_args} --ignore D205,D400,D103 "
-            f"--config {config_file}"
-        ),
-        stdout=subprocess.PIPE,
-        shell=True,
-    ) as proc:
-        stdout = proc.communicate()[0].decode(encoding="utf-8")
+    returncode = run_flake8(
+        [
+            str(code_file),
+            *extra_args.split(),
+            "--ignore",
+            "D205,D400,D103",
+            "--config",
+            str(config_file),
+        ]
+    )
 
-        assert not stdout, stdout
-        assert not proc.returncode
+    stdout = capsys.readouterr().out
+    assert not stdout, stdout
+    assert not returncode
 
 
 def test_self():
@@ -600,12 +635,20 @@ def test_self():
     when: flake8 is run against the source and tests of the linter
     then: the process exits with zero code and empty stdout
     """
-    with subprocess.Popen(
-        f"{sys.executable} -m flake8 flake8_docstrings_complete/ tests/ --ignore D205,D400,D103",
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "flake8",
+            "flake8_docstrings_complete/",
+            "tests/",
+            "--ignore",
+            "D205,D400,D103",
+        ],
         stdout=subprocess.PIPE,
-        shell=True,
-    ) as proc:
-        stdout = proc.communicate()[0].decode(encoding="utf-8")
+        check=False,
+        text=True,
+    )
 
-        assert not stdout, stdout
-        assert not proc.returncode
+    assert not proc.stdout, proc.stdout
+    assert not proc.returncode
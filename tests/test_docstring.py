@@ -114,6 +114,11 @@ from flake8_docstrings_complete import docstring
             (docstring._Section("name_1", ()),),
             id="single section many lines",
         ),
+        pytest.param(
+            ("name_1:", "description 1: text 1"),
+            (docstring._Section("name_1", ()),),
+            id="single section line with colon",
+        ),
         pytest.param(
             ("name_1:", ""), (docstring._Section("name_1", ()),), id="single section separator"
         ),
@@ -137,6 +142,16 @@ from flake8_docstrings_complete import docstring
             (docstring._Section("name_1", ()), docstring._Section("name_2", ())),
             id="multiple sections separator multiple whitespace",
         ),
+        pytest.param(
+            ("name_1:", " \t\f\v", "name_2:"),
+            (docstring._Section("name_1", ()), docstring._Section("name_2", ())),
+            id="multiple sections separator mixed whitespace",
+        ),
+        pytest.param(
+            ("name_1:", "", "", "name_2:"),
+            (docstring._Section("name_1", ()), docstring._Section("name_2", ())),
+            id="multiple sections multiple separators",
+        ),
         pytest.param(
             ("name_1:", "sub_name_1:", "", "name_2:"),
             (docstring._Section("name_1", ("sub_name_1",)), docstring._Section("name_2", ())),
@@ -190,6 +205,24 @@ long description""",
         pytest.param(
             """short description
 
+Args
+    arg_1
+    """,
+            docstring.Docstring(),
+            id="section without colon",
+        ),
+        pytest.param(
+            """short description
+
+Examples:
+    example_1:
+    """,
+            docstring.Docstring(),
+            id="other section",
+        ),
+        pytest.param(
+            """short description
+
 Args:
     """,
             docstring.Docstring(args=(), args_sections=("Args",)),
@@ -226,6 +259,24 @@ args:
         pytest.param(
             """short description
 
+ARGS:
+    arg_1:
+    """,
+            docstring.Docstring(args=("arg_1",), args_sections=("ARGS",)),
+            id="args upper case",
+        ),
+        pytest.param(
+            """short description
+
+aRgs:
+    arg_1:
+    """,
+            docstring.Docstring(args=("arg_1",), args_sections=("aRgs",)),
+            id="args mixed case",
+        ),
+        pytest.param(
+            """short description
+
 Arguments:
     arg_1:
     """,
@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+import re
+import sys
+
 import pytest
 
 from flake8_docstrings_complete import (
@@ -15,6 +18,7 @@ from flake8_docstrings_complete import (
     RETURNS_SECTION_NOT_IN_DOCSTR_MSG,
     YIELDS_SECTION_IN_DOCSTR_MSG,
     YIELDS_SECTION_NOT_IN_DOCSTR_MSG,
+    Plugin,
 )
 
 from . import result
@@ -795,6 +799,17 @@ def function_1():
         ),
         pytest.param(
             '''
+def function_1():
+    """Docstring 1."""
+    class Class1:
+        """Docstring."""
+        yield from tuple()
+''',
+            (),
+            id="function yield from value in class docstring no yields section",
+        ),
+        pytest.param(
+            '''
 def function_1():
     """Docstring 1.
 
@@ -836,6 +851,68 @@ class Class1:
             (),
             id="property yield value docstring no yields section",
         ),
+        pytest.param(
+            """
+if True:
+    def function_1():
+        pass
+else:
+    def function_2():
+        pass
+""",
+            (f"3:4 {DOCSTR_MISSING_MSG}", f"6:4 {DOCSTR_MISSING_MSG}"),
+            id="functions in if docstring missing",
+        ),
+        pytest.param(
+            """
+try:
+    def function_1():
+        pass
+except Exception:
+    def function_2():
+        pass
+else:
+    def function_3():
+        pass
+finally:
+    def function_4():
+        pass
+""",
+            (
+                f"3:4 {DOCSTR_MISSING_MSG}",
+                f"6:4 {DOCSTR_MISSING_MSG}",
+                f"9:4 {DOCSTR_MISSING_MSG}",
+                f"12:4 {DOCSTR_MISSING_MSG}",
+            ),
+            id="functions in try docstring missing",
+        ),
+        pytest.param(
+            """
+for value in values:
+    with context:
+        class Class1:
+            def function_1(self):
+                pass
+""",
+            (f"4:8 {DOCSTR_MISSING_MSG}", f"5:12 {DOCSTR_MISSING_MSG}"),
+            id="class and method in for and with docstring missing",
+        ),
+        pytest.param(
+            """
+match value:
+    case 1:
+        def function_1():
+            pass
+    case _:
+        class Class1:
+            pass
+""",
+            (f"4:8 {DOCSTR_MISSING_MSG}", f"7:8 {DOCSTR_MISSING_MSG}"),
+            id="function and class in match docstring missing",
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 10), reason="match requires Python 3.10"
+            ),
+        ),
     ],
 )
 def test_plugin(code: str, expected_result: tuple[str, ...]):
@@ -888,6 +965,18 @@ def test_():
         ),
         pytest.param(
             """
+def test_():
+    def foo():
+        yield 1
+
+    yield foo
+""",
+            "test_.py",
+            (f"3:4 {DOCSTR_MISSING_MSG}",),
+            id="test file test function nested function",
+        ),
+        pytest.param(
+            """
 def foo():
     pass
 """,
@@ -1016,3 +1105,21 @@ def test_plugin_filename(code: str, filename: str, expected_result: tuple[str, .
     then: the expected result is returned
     """
     assert result.get(code, filename) == expected_result
+
+
+def test_plugin_test_function_pattern(monkeypatch: pytest.MonkeyPatch):
+    """
+    given: a test function pattern that is not the default and code in a test file
+    when: linting is run on the code
+    then: only the functions matching the pattern are skipped
+    """
+    monkeypatch.setattr(Plugin, "_test_function_pattern", re.compile(r"check_.*"))
+    code = """
+def check_():
+    pass
+
+def test_():
+    pass
+"""
+
+    assert result.get(code, "test_.py") == (f"5:0 {DOCSTR_MISSING_MSG}",)
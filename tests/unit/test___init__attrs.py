@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from flake8_docstrings_complete import DOCSTR_MISSING_MSG
@@ -1195,6 +1197,76 @@ class Class1:
             (),
             id="class single attr method nested classmethod docstring no attrs",
         ),
+        pytest.param(
+            '''
+class Class1:
+    """Docstring 1.
+
+    Attrs:
+        attr_1:
+        attr_2:
+    """
+    if True:
+        attr_1 = "value 1"
+    else:
+        attr_2 = "value 2"
+''',
+            (),
+            id="class multiple attr in if docstring multiple attrs",
+        ),
+        pytest.param(
+            '''
+class Class1:
+    """Docstring 1."""
+    attr_1, attr_2 = "value 1", "value 2"
+''',
+            (),
+            id="class tuple target docstring no attrs",
+        ),
+        pytest.param(
+            '''
+class Class1:
+    """Docstring 1.
+
+    Attrs:
+        attr_1:
+    """
+    def method_1(self):
+        """Docstring 2."""
+        try:
+            pass
+        except Exception:
+            with context:
+                self.attr_1 = "value 1"
+''',
+            (),
+            id="class single attr method in try with docstring single attr",
+        ),
+        pytest.param(
+            '''
+class Class1:
+    """Docstring 1.
+
+    Attrs:
+        attr_1:
+        attr_2:
+    """
+    match value:
+        case 1:
+            attr_1 = "value 1"
+
+    def method_1(self):
+        """Docstring 2."""
+        match value:
+            case 1:
+                self.attr_2 = "value 2"
+''',
+            (),
+            id="class attr and method attr in match docstring multiple attrs",
+            marks=pytest.mark.skipif(
+                sys.version_info < (3, 10), reason="match requires Python 3.10"
+            ),
+        ),
     ],
 )
 def test_plugin(code: str, expected_result: tuple[str, ...]):